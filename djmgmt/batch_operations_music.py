@@ -12,6 +12,9 @@ import argparse
 import os
 import shutil
 import zipfile
+from typing import Iterable
+
+import constants
 
 # Helper functions
 def compress_dir(input_path: str, output_path: str):
@@ -84,7 +87,9 @@ def get_dirs(top: str) -> list[str]:
     return dirs
 
 # Primary functions
-def sweep(args: argparse.Namespace, valid_extensions: set[str], prefix_hints: set[str]) -> None:
+def sweep(args: argparse.Namespace, valid_extensions: Iterable[str], prefix_hints: set[str]) -> None:
+    # hash the extensions once so each per-file lookup is constant time
+    valid_extensions = valid_extensions if isinstance(valid_extensions, frozenset) else frozenset(valid_extensions)
     for working_dir, directories, filenames in os.walk(args.input):
         prune(working_dir, directories, filenames)
 
@@ -267,7 +272,6 @@ if __name__ == '__main__':
     FUNCTION_PRUNE = 'prune'
     FUNCTIONS_SINGLE_ARG = {FUNCTION_COMPRESS, FUNCTION_FLATTEN, FUNCTION_PRUNE}
     FUNCTIONS = {FUNCTION_FLATTEN, FUNCTION_SWEEP, FUNCTION_EXTRACT}.union(FUNCTIONS_SINGLE_ARG)
-    EXTENSIONS = {'.mp3', '.wav', '.aif', '.aiff', 'flac'}
     PREFIX_HINTS = {'beatport_tracks', 'juno_download'}
 
     # parse arguments
@@ -275,7 +279,7 @@ if __name__ == '__main__':
     print(f"will execute: '{script_args.function}'")
 
     if script_args.function == FUNCTION_SWEEP:
-        sweep(script_args, EXTENSIONS, PREFIX_HINTS)
+        sweep(script_args, constants.EXTENSIONS, PREFIX_HINTS)
     elif script_args.function == FUNCTION_FLATTEN:
         flatten_hierarchy(script_args)
     elif script_args.function == FUNCTION_EXTRACT:
@@ -18,6 +18,9 @@ MAPPING_MONTH = {
     12 : 'december',
 }
 
+# music file extensions
+EXTENSIONS = frozenset({'.mp3', '.wav', '.aif', '.aiff', '.flac'})
+
 # delimiters
 FILE_OPERATION_DELIMITER = '->'
 
@@ -74,10 +74,11 @@ def script(
                 node.attrib[ATTR_DATE_ADDED] = corrected_dates[track_id]
 
     # write the corrected collection to the specified file
-    tree_incorrect.write(
-        file_or_filename=path_collection_output,
-        encoding='UTF-8',
-        xml_declaration=True)
+    with open(path_collection_output, 'wb', buffering=1 << 20) as file:
+        tree_incorrect.write(
+            file_or_filename=file,
+            encoding='UTF-8',
+            xml_declaration=True)
 
 # MAIN
 if __name__ == '__main__':
@@ -27,6 +27,9 @@ import time
 import common
 import constants
 
+# Constants
+SCAN_POLL_INTERVAL_SECS = 1.0
+
 # Helper functions
 def normalize_paths(paths: list[str], parent: str) -> list[str]:
     '''Returns a collection with the given paths transformed to be relative to the given parent directory.
@@ -116,15 +119,25 @@ def format_timing(timestamp: float) -> str:
 def transfer_files(source_path: str, dest_address: str, rsync_module: str) -> None:
     import subprocess
     import shlex
+    import tempfile
     
-    options = "--progress -auvziR --exclude '.*'"
+    options = "--stats -auvziRW --exclude '.*'"
     command = shlex.split(f"rsync \"{source_path}\" {dest_address}/{rsync_module} {options}") # todo: use shlex.quote()
     try:
         logging.debug(f'run command: "{shlex.join(command)}"')
         timestamp = time.time()
-        process = subprocess.run(command, check=True, capture_output=True, encoding='utf-8')
+        # collect stderr in a temporary file so rsync can't block on a full stderr pipe while stdout is read
+        with tempfile.TemporaryFile('w+', encoding='utf-8') as stderr_file:
+            with subprocess.Popen(command, stdout=subprocess.PIPE, stderr=stderr_file, encoding='utf-8') as process:
+                # log the transfer output as it arrives instead of buffering it until rsync exits
+                assert process.stdout
+                for line in process.stdout:
+                    logging.debug(line.rstrip())
+            if process.returncode != 0:
+                stderr_file.seek(0)
+                raise subprocess.CalledProcessError(process.returncode, command, stderr=stderr_file.read())
         timestamp = time.time() - timestamp
-        logging.debug(f"total time: {format_timing(timestamp)}\n{process.stdout.strip()}")
+        logging.debug(f"total time: {format_timing(timestamp)}")
     except subprocess.CalledProcessError as error:
         logging.error(f"return code '{error.returncode}':\n{error.stderr.strip()}")
 
@@ -152,7 +165,7 @@ def sync_batch(batch: list[str], date_context: str, source: str, dest: str) -> N
                 if not content or content['scanning'] == 'false':
                     break
                 logging.debug("scan in progress, waiting...")
-                time.sleep(1)
+                time.sleep(SCAN_POLL_INTERVAL_SECS)
 
     else:
         logging.error(f"unable to transfer from '{source}' to '{dest}'")
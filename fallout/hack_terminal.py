@@ -3,20 +3,32 @@ Given an input text file of newline-separated words, this script
 assists a user in guessing Fallout terminal hacking puzzle.
 '''
 
+from collections import Counter
+import operator
 import sys
 
 # helpers
 def compare_similarity(lhs : str, rhs : str) -> int:
     '''
     Given two strings, returns the number of overlapping letters between the two.
+    Both strings are expected to be the same length, script() validates this when loading guesses.
     '''
-    assert len(lhs) == len(rhs), f"expecting equal string lengths for input: [{lhs} | {rhs}]"
+    return sum(map(operator.eq, lhs, rhs))
 
-    similarity = 0
-    for i in range(len(lhs)):
-        if lhs[i] == rhs[i]:
-            similarity += 1
-    return similarity
+def choose_guess(remaining: list[int], similarities: list[list[int]]) -> int:
+    '''
+    Returns the index of the remaining guess whose worst-case hint leaves the fewest remaining guesses.
+    Ties keep the earliest guess in the input order.
+    '''
+    choice, choice_worst = remaining[0], len(remaining)
+    for pivot in remaining:
+        # group the other remaining guesses by the hint they would produce for this pivot
+        row = similarities[pivot]
+        hints = Counter(row[other] for other in remaining if other != pivot)
+        worst = max(hints.values(), default=0)
+        if worst < choice_worst:
+            choice, choice_worst = pivot, worst
+    return choice
 
 ## main
 def script(path: str) -> None:
@@ -24,26 +36,42 @@ def script(path: str) -> None:
     The main script function.
     '''
 
-    guesses = []
-    # read file lines into guesses
-    # trim each guess in guesses
+    # stream file lines into guesses, trimming each guess as it is read
     with open(path, 'r', encoding='utf-8') as file:
-        guesses = [guess.rstrip() for guess in file.readlines()]
+        guesses = [guess.rstrip() for guess in file]
+
+    # drop duplicate guesses, keeping the first occurrence of each
+    guesses = list(dict.fromkeys(guesses))
 
     # validate input
     assert len(guesses) > 1, 'expect at least 2 guesses'
-    for i in range(1, len(guesses)):
-        assert len(guesses[i]) == len(guesses[i-1]), 'all guesses should be equal length'
+    length = len(guesses[0])
+    mismatch = next((guess for guess in guesses if len(guess) != length), None)
+    assert mismatch is None, f"all guesses should be equal length, '{mismatch}' differs from {length}"
 
-    while len(guesses) > 0:
-        prompt = 'next guess'
-        print(f"{prompt}: {guesses[0]}")
+    # compare every pair of guesses once up front, so each hint is a row lookup
+    # similarity is symmetric, so each pair is computed once and mirrored
+    # a guess fully matches itself, so the diagonal is the guess length
+    count = len(guesses)
+    similarities = [[length] * count for _ in range(count)]
+    for i in range(count):
+        for j in range(i + 1, count):
+            similarities[i][j] = similarities[j][i] = compare_similarity(guesses[i], guesses[j])
+
+    # track the remaining guesses by their index into the table
+    remaining = list(range(len(guesses)))
 
-        guess = guesses.pop(0)
+    while remaining:
+        # pick the guess that eliminates the most remaining guesses in the worst case
+        guess = choose_guess(remaining, similarities)
+        remaining.remove(guess)
+
+        prompt = 'next guess'
+        print(f"{prompt}: {guesses[guess]}")
 
         # read the result of the guess
         prompt = 'was the guess correct (y/n)?\n'
-        result = input(prompt).lower()
+        result = input(prompt).strip().casefold()
         if result == 'y':
             print('SUCCESS!\nExiting...')
             sys.exit()
@@ -51,18 +79,11 @@ def script(path: str) -> None:
             # input
             prompt = 'guess hint (integer)?\n'
             hint = int(input(prompt))
-            possibilities = []
-
-            # compare remaining guesses with recent guess + hint
-            for possibility in guesses:
-                similarity = compare_similarity(guess, possibility)
-
-                if similarity == hint:
-                    possibilities.append(possibility)
 
-            guesses = possibilities
+            # keep only the remaining guesses that match the recent guess + hint
+            remaining = [possibility for possibility in remaining if similarities[guess][possibility] == hint]
         else:
-            raise Exception("InvalidInput: {result}. Expect y/n")
+            raise ValueError(f"InvalidInput: '{result}'. Expect y/n")
 
 
 if __name__ == '__main__':
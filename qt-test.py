@@ -1,21 +1,27 @@
-from PyQt6.QtWidgets import QApplication, QWidget
 import sys
 
-class Window(QWidget):
-    def __init__(self):
-        super().__init__()
+def main() -> None:
+    # import Qt here so its shared libraries only load when the script is run
+    from PyQt6.QtWidgets import QApplication, QWidget
 
-        self.setWindowTitle("genres")
-        
-        stylesheet = (
-            "background-color : grey;"
-        )
+    class Window(QWidget):
+        def __init__(self):
+            super().__init__()
 
-        self.setStyleSheet(stylesheet)
+            self.setWindowTitle("genres")
+            
+            stylesheet = (
+                "background-color : grey;"
+            )
 
-app = QApplication(sys.argv)
+            self.setStyleSheet(stylesheet)
 
-window = Window()
-window.show()
+    app = QApplication(sys.argv)
 
-sys.exit(app.exec())
\ No newline at end of file
+    window = Window()
+    window.show()
+
+    sys.exit(app.exec())
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file